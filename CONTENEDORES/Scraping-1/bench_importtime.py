@@ -0,0 +1,77 @@
+"""Import-time benchmark guarding the startup cost of `scraper`.
+
+Imports the module in a fresh interpreter with `python -X importtime` and fails
+if Selenium / webdriver-manager got loaded or the cumulative import time exceeds
+the budget. Usage:
+
+    python bench_importtime.py [--budget-ms 300] [--module scraper]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FORBIDDEN_PREFIXES = ("selenium", "webdriver_manager")
+DEFAULT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "300"))
+
+
+def run_importtime(module: str) -> List[Tuple[int, int, str]]:
+    """Return (self_us, cumulative_us, name) rows parsed from `-X importtime`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=HERE,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"No se pudo importar {module}:\n{proc.stderr}")
+
+    rows: List[Tuple[int, int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header line
+        rows.append((self_us, cum_us, parts[2].strip()))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="scraper")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    rows = run_importtime(args.module)
+    total_ms = next(
+        (cum / 1000.0 for _, cum, name in rows if name == args.module), 0.0
+    )
+    forbidden = sorted(
+        {name for _, _, name in rows if name.startswith(FORBIDDEN_PREFIXES)}
+    )
+
+    print(f"import {args.module}: {total_ms:.1f} ms (presupuesto {args.budget_ms:.0f} ms)")
+    for _, cum, name in sorted(rows, reverse=True, key=lambda r: r[1])[:10]:
+        print(f"  {cum / 1000.0:8.1f} ms  {name}")
+
+    ok = True
+    if forbidden:
+        print(f"✗ Se cargaron módulos pesados en el arranque: {', '.join(forbidden[:5])}")
+        ok = False
+    if total_ms > args.budget_ms:
+        print(f"✗ El import excede el presupuesto ({total_ms:.1f} ms > {args.budget_ms:.0f} ms)")
+        ok = False
+    if ok:
+        print("✓ Arranque dentro del presupuesto")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,10 @@
+from __future__ import annotations
+
 import os
 import time
 import json
 import unicodedata
-from typing import Dict, List, Optional
-from urllib.request import urlopen, Request
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 # Offline parsing
 try:
@@ -11,19 +12,10 @@ try:
 except Exception:
     BeautifulSoup = None  # will handle gracefully
 
-from selenium import webdriver
-from selenium.common.exceptions import (
-    ElementClickInterceptedException,
-    ElementNotInteractableException,
-    NoSuchElementException,
-    StaleElementReferenceException,
-    TimeoutException,
-)
-from selenium.webdriver import ActionChains
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+# Selenium is imported inside the functions that drive the browser, so the
+# offline path (and `parse_offline_html` used as a library) starts without it.
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 TARGET_URL = "https://cse.izt.uam.mx/index.php/home/preguntas"
 TIMEOUT = 25
@@ -32,6 +24,8 @@ EXPAND_WAIT_SECONDS = 8
 
 
 def is_grid_ready(base_url: str) -> bool:
+    from urllib.request import urlopen, Request
+
     for path in ("/status", "/wd/hub/status"):
         try:
             url = base_url.rstrip("/") + path
@@ -48,6 +42,8 @@ def is_grid_ready(base_url: str) -> bool:
 
 
 def wait_for_grid(base_url: str, timeout: int = 90) -> None:
+    from selenium.common.exceptions import TimeoutException
+
     print(f"Esperando Selenium Grid en {base_url} ...")
     start = time.time()
     while time.time() - start < timeout:
@@ -59,6 +55,9 @@ def wait_for_grid(base_url: str, timeout: int = 90) -> None:
 
 
 def build_driver() -> webdriver.Remote:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
     chrome_options = Options()
     chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--no-sandbox")
@@ -102,6 +101,10 @@ def build_driver() -> webdriver.Remote:
 
 
 def wait_page_ready(driver: webdriver.Remote, timeout: int = TIMEOUT) -> None:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     WebDriverWait(driver, timeout).until(
         lambda d: d.execute_script("return document.readyState") == "complete"
     )
@@ -111,6 +114,8 @@ def wait_page_ready(driver: webdriver.Remote, timeout: int = TIMEOUT) -> None:
 
 
 def close_cookie_banners(driver: webdriver.Remote) -> None:
+    from selenium.webdriver.common.by import By
+
     candidates = [
         "//button[contains(translate(., 'ACEPTARACEPTOOKENTENDIDO', 'aceptaraceptookentendido'), 'aceptar')]",
         "//button[contains(translate(., 'ACEPTARACEPTOOKENTENDIDO', 'aceptaraceptookentendido'), 'acepto')]",
@@ -142,6 +147,8 @@ def normalize_text(s: str) -> str:
 
 
 def is_displayed_with_text(el) -> bool:
+    from selenium.common.exceptions import StaleElementReferenceException
+
     try:
         return el.is_displayed() and len(el.text.strip()) > 0
     except StaleElementReferenceException:
@@ -149,6 +156,12 @@ def is_displayed_with_text(el) -> bool:
 
 
 def safe_click(driver: webdriver.Remote, el) -> None:
+    from selenium.common.exceptions import (
+        ElementClickInterceptedException,
+        ElementNotInteractableException,
+    )
+    from selenium.webdriver import ActionChains
+
     try:
         driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
     except Exception:
@@ -173,6 +186,9 @@ def safe_click(driver: webdriver.Remote, el) -> None:
 
 
 def find_candidate_headers(driver: webdriver.Remote) -> List:
+    from selenium.common.exceptions import StaleElementReferenceException
+    from selenium.webdriver.common.by import By
+
     xpaths = [
         "//*[@data-toggle='collapse' or @data-bs-toggle='collapse' or @aria-controls or contains(@class,'accordion') or contains(@class,'panel-title') or contains(@class,'accordion-header')]",
         "//h2 | //h3 | //button | //a",
@@ -217,6 +233,9 @@ def find_candidate_headers(driver: webdriver.Remote) -> List:
 
 
 def resolve_click_target(header):
+    from selenium.common.exceptions import NoSuchElementException
+    from selenium.webdriver.common.by import By
+
     try:
         child = header.find_element(By.XPATH, ".//button|.//a")
         return child
@@ -241,6 +260,9 @@ def resolve_click_target(header):
 
 
 def wait_for_expansion(driver: webdriver.Remote, header) -> Optional[object]:
+    from selenium.common.exceptions import StaleElementReferenceException
+    from selenium.webdriver.common.by import By
+
     start = time.time()
     before_h = driver.execute_script("return document.body.scrollHeight")
     aria_before = None
@@ -418,6 +440,8 @@ def main():
             print(f"Parser offline falló: {e}. Intentando Selenium…")
 
     # Selenium path as fallback or when OFFLINE_HTML not present
+    from selenium.webdriver.common.by import By
+
     driver = build_driver()
     try:
         driver.get(TARGET_URL)